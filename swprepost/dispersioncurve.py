@@ -18,6 +18,7 @@
 """DispersionCurve class definition."""
 
 import logging
+from functools import lru_cache
 
 import numpy as np
 
@@ -28,6 +29,38 @@ logger = logging.getLogger(name=__name__)
 __all__ = ['DispersionCurve']
 
 
+def _frequency_velocity(pairs):
+    """Frequency and velocity from flat `ndarray` of `frequency, slowness`.
+
+    Pairs following the first decrease in frequency are discarded.
+
+    """
+    if pairs.size % 2:
+        msg = f"Expected `frequency slowness` pairs, found {pairs.size} values."
+        raise ValueError(msg)
+    frequency, slowness = pairs[0::2], pairs[1::2]
+    decreasing = frequency[1:] < frequency[:-1]
+    if decreasing.any():
+        stop = decreasing.argmax() + 1
+        frequency, slowness = frequency[:stop], slowness[:stop]
+    return (frequency, 1/slowness)
+
+
+@lru_cache(maxsize=4096)
+def _read_pairs(pairs_data):
+    """Read `frequency slowness` pairs into read-only `ndarray`s.
+
+    Results are cached as suites of models often repeat identical
+    curves, `DispersionCurve` copies the values on instantiation.
+
+    """
+    pairs = np.fromstring(pairs_data, dtype=np.double, sep=" ")
+    pairs.flags.writeable = False
+    frequency, velocity = _frequency_velocity(pairs)
+    velocity.flags.writeable = False
+    return (frequency, velocity)
+
+
 class DispersionCurve(Curve):
     """Class to define a `DispersionCurve` object.
 
@@ -102,21 +135,29 @@ class DispersionCurve(Curve):
         Only lines 2 and 3 will be parsed.
 
         """
-        frequency, slowness = [], []
-        for curve in regex.dc_data.finditer(dc_data):
-            f, p = curve.groups()
-            f = float(f)
-            try:
-                if f < frequency[-1]:
-                    break
-                else:
-                    frequency.append(f)
-                    slowness.append(float(p))
-            except IndexError:
-                frequency.append(f)
-                slowness.append(float(p))
-        return cls(frequency=frequency, velocity=1/np.array(slowness,
-                                                            dtype=np.double))
+        pairs = np.array(regex.dc_data.findall(dc_data), dtype=np.double)
+        frequency, velocity = _frequency_velocity(pairs.flatten())
+        return cls(frequency=frequency, velocity=velocity)
+
+    @classmethod
+    def _parse_pairs(cls, pairs_data):
+        """Parse a single `DispersionCurve` from `frequency slowness` pairs.
+
+        Parameters
+        ----------
+        pairs_data : {str, bytes}
+            Whitespace delimited `frequency slowness` pairs, without any
+            comment lines. It is assumed that frequencies increase
+            monotonically, see :meth: `_parse_dc <DispersionCurve._parse_dc>`.
+
+        Returns
+        -------
+        DispersionCurve
+            Instantiated `DispersionCurve` object.
+
+        """
+        frequency, velocity = _read_pairs(pairs_data)
+        return cls(frequency=frequency, velocity=velocity)
 
     @classmethod
     def from_geopsy(cls, fname):
@@ -140,10 +181,8 @@ class DispersionCurve(Curve):
     @property
     def txt_repr(self):
         """Text representation following the Geopsy format."""
-        lines = ""
-        for f, p in zip(self.frequency, self.slowness):
-            lines += f"{f} {p}\n"
-        return lines
+        return "".join([f"{f} {p}\n" for f, p in zip(self.frequency.tolist(),
+                                                       self.slowness.tolist())])
 
     def write_curve(self, fileobj):
         """Append `DispersionCurve` to open file object.
@@ -112,7 +112,7 @@ class DispersionSet():
 
         dcs = {}
         for mode_number, dc_data in enumerate(modes):
-            dcs.update({mode_number: cls._dc()._parse_dc(dc_data)})
+            dcs.update({mode_number: cls._dc()._parse_pairs(dc_data)})
         return dcs
 
     @classmethod
@@ -185,6 +185,22 @@ class DispersionSet():
             data = f.read()
         return cls._from_full_file(data, nrayleigh=nrayleigh, nlove=nlove)
 
+    @property
+    def txt_repr(self):
+        """Text representation following the Geopsy format."""
+        misfit = 0.0 if self.misfit is None else self.misfit
+        lines = []
+        for wave, dcs in [("Rayleigh", self.rayleigh), ("Love", self.love)]:
+            if dcs is None:
+                continue
+            lines.append(f"# Layered model {self.identifier}: value={misfit}\n")
+            lines.append(f"# {len(dcs)} {wave} dispersion mode(s)\n")
+            lines.append(f"# CPU Time = 0 ms\n")
+            for key, value in dcs.items():
+                lines.append(f"# Mode {key}\n")
+                lines.append(value.txt_repr)
+        return "".join(lines)
+
     def write_set(self, fileobj):
         """Write `DispersionSet` to current file.
         
@@ -199,21 +215,7 @@ class DispersionSet():
             Writes file to disk.
 
         """
-        misfit = 0.0 if self.misfit is None else self.misfit
-        if self.rayleigh is not None:
-            fileobj.write(f"# Layered model {self.identifier}: value={misfit}\n")
-            fileobj.write(f"# {len(self.rayleigh)} Rayleigh dispersion mode(s)\n")
-            fileobj.write(f"# CPU Time = 0 ms\n")
-            for key, value in self.rayleigh.items():
-                fileobj.write(f"# Mode {key}\n")
-                value.write_curve(fileobj)
-        if self.love is not None:
-            fileobj.write(f"# Layered model {self.identifier}: value={misfit}\n")
-            fileobj.write(f"# {len(self.love)} Love dispersion mode(s)\n")
-            fileobj.write(f"# CPU Time = 0 ms\n")
-            for key, value in self.love.items():
-                fileobj.write(f"# Mode {key}\n")
-                value.write_curve(fileobj)
+        fileobj.write(self.txt_repr)
     
     def write_to_txt(self, fname):
         """Write `DispersionSet` to Geopsy formated file.
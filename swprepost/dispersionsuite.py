@@ -17,7 +17,13 @@
 
 """DispersionSuite class definition."""
 
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from itertools import islice
 import logging
+import mmap
+
+import numpy as np
 
 from swprepost import DispersionSet, Suite, regex
 
@@ -25,14 +31,71 @@ logger = logging.getLogger(__name__)
 
 __all__ = ["DispersionSuite"]
 
+_MODEL_START = b"# Layered model"
+_MODE_START = b"# Mode "
+_NUMBER_START = b"0123456789.+-"
+
+
+@contextmanager
+def _open_buffer(fname):
+    """Open `fname` as a read-only bytes-like object.
+
+    The file is memory-mapped where possible, otherwise (e.g., pipes or
+    file systems without mmap support) it is read in binary mode.
+    Yields the buffer and whether it was memory-mapped.
+
+    """
+    with open(fname, "rb") as f:
+        try:
+            buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            buf = None
+        if buf is None:
+            yield (f.read(), False)
+        else:
+            with buf:
+                yield (buf, True)
+
+
+def _model_identifier(buf, pos):
+    """Identifier of the model header at `pos`, `None` if invalid."""
+    header = regex.dc_header.match(buf, pos)
+    if header is None:
+        return None
+    return header.group("identifier")
+
+
+def _shard_bounds(buf, nshards):
+    """Split `buf` into at most `nshards` `(start, stop)` byte ranges.
+
+    Ranges begin at a model header and never separate the Rayleigh and
+    Love blocks of a model.
+
+    """
+    starts = [max(buf.find(_MODEL_START), 0)]
+    for shard in range(1, nshards):
+        pos = buf.find(b"\n" + _MODEL_START, len(buf)*shard//nshards)
+        while pos != -1:
+            pos += 1
+            previous = buf.rfind(_MODEL_START, 0, pos)
+            if _model_identifier(buf, previous) != _model_identifier(buf, pos):
+                break
+            pos = buf.find(b"\n" + _MODEL_START, pos)
+        if pos == -1:
+            break
+        if pos > starts[-1]:
+            starts.append(pos)
+    return list(zip(starts, starts[1:] + [len(buf)]))
+
 
 class DispersionSuite(Suite):
     """Container for instantiated `DispersionSet` objects.
 
     Attributes
     ----------
-    sets : list
-        Container for instantiated `DispersionSet` objects.
+    sets : tuple
+        Container for instantiated `DispersionSet` objects, use
+        `append` to add to the suite.
 
     """
     @staticmethod
@@ -71,7 +134,7 @@ class DispersionSuite(Suite):
 
     @property
     def sets(self):
-        return self._items
+        return self._items_view
 
     def append(self, dispersionset, sort=True):
         """Append `DispersionSet` object to `DispersionSuite`.
@@ -91,7 +154,9 @@ class DispersionSuite(Suite):
             If `dispersionset` is not of type `DispersionSet`.
 
         """
-        self.check_input(dispersionset, DispersionSet)
+        if not isinstance(dispersionset, DispersionSet):
+            msg = f"Must be instance of {DispersionSet}, not {type(dispersionset)}."
+            raise TypeError(msg)
         super().append(dispersionset, sort=sort)
 
     @property
@@ -110,7 +175,7 @@ class DispersionSuite(Suite):
 
     @classmethod
     def from_geopsy(cls, fname, nsets="all", nrayleigh="all", nlove="all",
-                    sort=False):
+                    sort=False, ncores=1):
         """Instantiate from a text file following the Geopsy format.
 
         Parameters
@@ -127,47 +192,121 @@ class DispersionSuite(Suite):
             Indicates whether the imported data should be sorted from
             lowest to highest misfit, default is `False` indicating no
             sorting is performed.
+        ncores : int, optional
+            Number of processes used to parse the file when
+            `nsets="all"`, default is 1 so the file is parsed in the
+            current process. Files that cannot be memory-mapped (e.g.,
+            pipes) are always parsed in the current process.
 
         Returns
         -------
         DispersionSuite
             Instantiated `DispersionSuite` object.
 
+        Raises
+        ------
+        ValueError
+            If a line of dispersion data starts with a number but is not
+            a `frequency slowness` pair separated by a single space
+            (e.g., trailing whitespace, tabs, or `nan`).
+        ValueError
+            If `fname` does not contain any `DispersionSet`.
+
         """
-        with open(fname, "r") as f:
-            lines = f.read()
+        with _open_buffer(fname) as (buf, mapped):
+            if nsets != "all" or ncores <= 1 or not mapped:
+                dc_sets = cls._iter_sets(buf, 0, len(buf),
+                                         nrayleigh=nrayleigh, nlove=nlove)
+                nsets = None if nsets == "all" else nsets
+                dc_sets = list(islice(dc_sets, nsets))
+                return cls._from_validated_list(dc_sets, sort=sort)
+            bounds = _shard_bounds(buf, ncores)
+
+        nshards = len(bounds)
+        starts, stops = zip(*bounds)
+        with ProcessPoolExecutor(max_workers=min(ncores, nshards)) as executor:
+            shards = executor.map(cls._parse_shard, [fname]*nshards,
+                                  starts, stops, [nrayleigh]*nshards,
+                                  [nlove]*nshards)
+            dc_sets = [dc_set for shard in shards for dc_set in shard]
+        return cls._from_validated_list(dc_sets, sort=sort)
+
+    @classmethod
+    def _parse_shard(cls, fname, start, stop, nrayleigh="all", nlove="all"):
+        """Parse the `DispersionSet` objects between `start` and `stop`."""
+        with _open_buffer(fname) as (buf, _):
+            return list(cls._iter_sets(buf, start, stop,
+                                       nrayleigh=nrayleigh, nlove=nlove))
 
-        dc_sets = []
-        previous_id, previous_misfit = "start", "0"
+    @classmethod
+    def _iter_sets(cls, buf, start, stop, nrayleigh="all", nlove="all"):
+        """Iterate over `DispersionSet` objects in Geopsy-style `buf`.
+
+        Parameters
+        ----------
+        buf : bytes-like
+            Contents of Geopsy-style text file.
+        start, stop : int
+            Byte range of `buf` to be parsed.
+        nrayleigh, nlove : {"all", int}, optional
+            Refer to :meth: `from_geopsy <DispersionSuite.from_geopsy>`.
+
+        Yields
+        ------
+        DispersionSet
+            Each set once all of its wave types have been read.
+
+        """
+        dcset = cls._dcset()
+        parse_pairs = dcset._dc()._parse_pairs
+        match_header = regex.dc_header.match
+        match_pairs = regex.dc_pairs.match
+        find = buf.find
+
+        identifier, misfit = None, None
         rayleigh, love = None, None
-        model_count = 0
-        for model_info in regex.dcset.finditer(lines):
-            identifier, misfit, wave_type, data = model_info.groups()
-
-            if identifier != previous_id and previous_id != "start":
-                dc_sets.append(cls._dcset()(previous_id,
-                                            float(previous_misfit),
-                                            rayleigh=rayleigh, love=love))
-                model_count += 1
+        modes, nmodes = {}, 0
+        pos = find(_MODEL_START, start, stop)
+        while pos != -1:
+            # Mode -> pairs run until the first line that is not a pair.
+            if buf[pos:pos+len(_MODE_START)] == _MODE_START:
+                data_start = find(b"\n", pos, stop) + 1
+                if data_start == 0:
+                    break
+                pos = match_pairs(buf, data_start, stop).end()
+                head = buf[pos:min(pos+32, stop)].lstrip(b" \t")[:1]
+                if head and head in _NUMBER_START:
+                    msg = f"Invalid dispersion data at byte {pos}."
+                    raise ValueError(msg)
+                if pos > data_start and (nmodes == "all" or len(modes) < nmodes):
+                    modes[len(modes)] = parse_pairs(buf[data_start:pos])
+                continue
+
+            # Layered model -> new wave type, and possibly new set.
+            header = match_header(buf, pos, stop)
+            if header is None:
+                pos = find(_MODEL_START, pos + 1, stop)
+                continue
+            pos = header.end()
+
+            current_id = header.group("identifier").decode("ascii")
+            if current_id != identifier:
+                if identifier is not None:
+                    yield dcset(identifier, float(misfit),
+                                rayleigh=rayleigh, love=love)
+                identifier = current_id
                 rayleigh, love = None, None
+            misfit = header.group("misfit").decode("ascii")
 
-            if wave_type == "Rayleigh":
-                rayleigh = cls._dcset()._parse_dcs(data, nmodes=nrayleigh)
-            elif wave_type == "Love":
-                love = cls._dcset()._parse_dcs(data, nmodes=nlove)
+            if header.group("wave") == b"Rayleigh":
+                rayleigh, nmodes = {}, nrayleigh
+                modes = rayleigh
             else:
-                raise NotImplementedError
-
-            previous_id = identifier
-            previous_misfit = misfit
-
-            if model_count + 1 == nsets:
-                break
+                love, nmodes = {}, nlove
+                modes = love
 
-        dc_sets.append(cls._dcset()(previous_id,
-                                    float(previous_misfit),
-                                    rayleigh=rayleigh, love=love))
-        return cls.from_list(dc_sets, sort=sort)
+        if identifier is not None:
+            yield dcset(identifier, float(misfit), rayleigh=rayleigh, love=love)
 
     @classmethod
     def _dcset(cls):
@@ -192,11 +331,27 @@ class DispersionSuite(Suite):
         DipsersionSuite
             Instatiated `DispersionSuite` object.
 
+        Raises
+        ------
+        TypeError
+            If any entry of `dc_sets` is not of type `DispersionSet`.
+        ValueError
+            If `dc_sets` is empty.
+
         """
-        obj = cls(dc_sets[0])
-        if len(dc_sets) > 1:
-            for dc_set in dc_sets[1:]:
-                obj.append(dc_set, sort=sort)
+        for dc_set in dc_sets:
+            cls.check_input(dc_set, DispersionSet)
+        return cls._from_validated_list(dc_sets, sort=sort)
+
+    @classmethod
+    def _from_validated_list(cls, dc_sets, sort=True):
+        """Instantiate from a list of checked `DispersionSet` objects."""
+        if len(dc_sets) == 0:
+            raise ValueError("`dc_sets` must contain at least one DispersionSet.")
+        obj = cls.__new__(cls)
+        obj._set_items(dc_sets)
+        if sort:
+            obj._sort()
         return obj
 
     def write_to_txt(self, fname, nbest="all"):
@@ -207,8 +362,9 @@ class DispersionSuite(Suite):
         fname : str
             Name of file, may be a relative or the full path.
         nbest : {int, 'all'}, optional
-            Number of best models to write to file, default is 'all'
-            indicating all models will be written.
+            Number of best (i.e., lowest misfit) models to write to
+            file, default is 'all' indicating all models will be
+            written. Models are written from lowest to highest misfit.
 
         Returns
         -------
@@ -219,13 +375,31 @@ class DispersionSuite(Suite):
         nbest = self._handle_nbest(nbest)
         with open(fname, "w") as f:
             f.write("# File written by swipp\n")
-            for cit in self.sets[:nbest]:
-                cit.write_set(f)
+            for index in self._best_indices(nbest):
+                self._items[index].write_set(f)
+
+    def _best_indices(self, nbest):
+        """Indices of the `nbest` lowest misfit sets, ordered by misfit.
+
+        Ties are resolved in favor of the set appearing first.
+
+        """
+        if nbest <= 0:
+            return []
+        misfits = self._misfit_arr
+        if nbest < self.size:
+            kth = np.partition(misfits, nbest-1)[nbest-1]
+            below = np.flatnonzero(misfits < kth)
+            ties = np.flatnonzero(misfits == kth)[:nbest-below.size]
+            indices = np.concatenate((below, ties))
+        else:
+            indices = np.arange(self.size)
+        return indices[np.lexsort((indices, misfits[indices]))].tolist()
 
     def __getitem__(self, slce):
         """Define slicing behavior"""
-        return self.sets[slce]
+        return self._items[slce]
 
     def __str__(self):
         """Human-readable representation of the object."""
-        return f"DispersionSuite with {len(self.sets)} DispersionSets."
+        return f"DispersionSuite with {len(self._items)} DispersionSets."
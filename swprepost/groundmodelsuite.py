@@ -34,8 +34,9 @@ class GroundModelSuite(Suite):
 
     Attributes
     ----------
-    gms : list
-        List of `GroundModel` objects, composing the suite.
+    gms : tuple
+        `GroundModel` objects composing the suite, use `append` to
+        add to the suite.
 
     """
     @staticmethod
@@ -70,11 +71,11 @@ class GroundModelSuite(Suite):
 
     @property
     def gms(self):
-        return self._items
+        return self._items_view
 
     @property
     def size(self):
-        return len(self.gms)
+        return len(self._items)
 
     def append(self, groundmodel, sort=True):
         """Append `GroundModel` object to `GroundModelSuite` object.
@@ -343,13 +344,13 @@ class GroundModelSuite(Suite):
 
     def __getitem__(self, sliced):
         if isinstance(sliced, int):
-            return self.gms[sliced]
+            return self._items[sliced]
         if isinstance(sliced, slice):
-            return self._gm_suite().from_list(self.gms[sliced])
+            return self._gm_suite().from_list(self._items[sliced])
 
     def __str__(self):
         """Human-readable representation of a `GroundModelSuite`."""
-        return f"GroundModelSuite with {len(self.gms)} GroundModels."
+        return f"GroundModelSuite with {len(self._items)} GroundModels."
 
     def __repr__(self):
         """Unambiguos representation of a `GroundModelSuite`."""
@@ -19,23 +19,33 @@
 
 import re
 
-number = r"\d+.?\d*[eE]?[+-]?\d*"
+number = r"\d+(?:\.\d*)?(?:[eE][+-]?\d+)?"
 
 # DC
 pair = f"{number} {number}\n"
-model_txt = r"# Layered model (\d+): value=(\d+.?\d*)"
+model_txt = rf"# Layered model (\d+): value=({number})"
 wave_txt = r"# \d+ (Rayleigh|Love) dispersion mode\(s\)"
 mode_txt = r"# Mode \d+\n"
-dcset_txt = f"{model_txt}\n{wave_txt}\n.*\n((?:{mode_txt}(?:{pair})+)+)"
+dcset_txt = f"^{model_txt}\n{wave_txt}\n[^\n]*\n((?:{mode_txt}(?:{pair})+)+)"
 
 model = re.compile(model_txt)
 mode = re.compile(mode_txt)
-dcset = re.compile(dcset_txt)
+dcset = re.compile(dcset_txt, re.MULTILINE)
 dc_data = re.compile(f"({number}) ({number})")
 
+# DC - Header (scanned with bytes.find, see DispersionSuite._iter_sets)
+dc_model_txt = rf"# Layered model (?P<identifier>\d+): value=(?P<misfit>{number})"
+dc_wave_txt = r"# \d+ (?P<wave>Rayleigh|Love) dispersion mode\(s\)"
+dc_header_txt = f"^{dc_model_txt}\r?\n{dc_wave_txt}\r?\n[^\n]*\n"
+
+dc_pairs_txt = r"(?:[\d.eE+-]+ [\d.eE+-]+(?:\r?\n|\Z))*"
+
+dc_header = re.compile(dc_header_txt.encode("ascii"), re.MULTILINE)
+dc_pairs = re.compile(dc_pairs_txt.encode("ascii"))
+
 # GM
 quad = f"{number} {number} {number} {number}\n"
-gm_txt = f"{model_txt}\n\d+\n((?:{quad})+)"
+gm_txt = rf"^{model_txt}\n\d+\n((?:{quad})+)"
 
-gm = re.compile(gm_txt)
+gm = re.compile(gm_txt, re.MULTILINE)
 gm_data = re.compile(f"({number}) ({number}) ({number}) ({number})")
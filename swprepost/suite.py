@@ -30,26 +30,56 @@ class Suite(ABC):
     @abstractmethod
     def __init__(self, item):
         """Create `Suite` from `item`."""
-        self._items = [item]
+        self._set_items([item])
+
+    def _set_items(self, items):
+        """Replace the contents of `Suite` with `items`."""
+        self._items = list(items)
+        self._view = None
+        self._ids = [item.identifier for item in self._items]
+        self._misfit_buf = np.array([item.misfit for item in self._items],
+                                    dtype=np.double)
 
     def append(self, item, sort=True):
         """Append item to `Suite`."""
+        size = len(self._items)
+        if size == self._misfit_buf.size:
+            self._misfit_buf = np.resize(self._misfit_buf, 2*size)
+        self._misfit_buf[size] = item.misfit
         self._items.append(item)
+        self._view = None
+        self._ids.append(item.identifier)
         if sort:
             self._sort()
 
     def _sort(self):
         """Define how to sort `Suite`."""
-        self._items = [x for _, x in sorted(zip(self.misfits, self._items),
-                                            key=lambda pair: pair[0])]
+        order = np.argsort(self._misfit_arr, kind="stable")
+        self._misfit_buf = self._misfit_arr[order]
+        order = order.tolist()
+        self._items = [self._items[index] for index in order]
+        self._view = None
+        self._ids = [self._ids[index] for index in order]
+
+    @property
+    def _items_view(self):
+        """Read-only `tuple` of the items in `Suite`, cached until modified."""
+        if self._view is None:
+            self._view = tuple(self._items)
+        return self._view
+
+    @property
+    def _misfit_arr(self):
+        """Misfits of the items in `Suite` as an `ndarray`."""
+        return self._misfit_buf[:len(self._items)]
 
     @property
     def misfits(self):
-        return [_items.misfit for _items in self._items]
+        return self._misfit_arr.tolist()
 
     @property
     def identifiers(self):
-        return [_items.identifier for _items in self._items]
+        return list(self._ids)
 
     def _handle_nbest(self, nbest):
         """Accept common `nbest` values and return the logical result."""
@@ -94,12 +124,13 @@ class Suite(ABC):
             (min_msft, max_msft).
 
         """
+        misfits = self._misfit_arr
         if nmodels == "all":
-            return (self.misfits[0], self.misfits[-1])
+            return (float(misfits[0]), float(misfits[-1]))
         elif nmodels == 1:
-            return self.misfits[0]
+            return float(misfits[0])
         else:
-            return (self.misfits[0], self.misfits[nmodels-1])
+            return (float(misfits[0]), float(misfits[nmodels-1]))
 
     def misfit_repr(self, nmodels="all", **kwargs):
         """String representation of misfit [min-max] or [min].
@@ -134,6 +165,10 @@ class Suite(ABC):
         """Define when two Suite objects are equal."""
         if self.size != other.size:
             return False
+        if self._ids != other._ids:
+            return False
+        if not np.array_equal(self._misfit_arr, other._misfit_arr):
+            return False
         for my, ur in zip(self._items, other._items):
             if my != ur:
                 return False
@@ -70,6 +70,24 @@ class Test_DispersionCurve(TestCase):
         self.assertArrayEqual(expected_frequency, dc.frequency)
         self.assertArrayEqual(expected_slowness, dc.slowness)
 
+    def test_parse_pairs(self):
+        data = b"0.1 0.01\n0.2 0.012\n0.3 0.0125\n0.1 0.011\n"
+        dc_a = swprepost.DispersionCurve._parse_pairs(data)
+        self.assertArrayEqual(np.array([0.1, 0.2, 0.3]), dc_a.frequency)
+        self.assertArrayAlmostEqual(np.array([100, 1/0.012, 80]),
+                                    dc_a.velocity, places=10)
+
+        # Repeated data -> independent objects
+        dc_b = swprepost.DispersionCurve._parse_pairs(data)
+        self.assertEqual(dc_a, dc_b)
+        dc_b._x[0] = 0.05
+        self.assertEqual(0.1, dc_a.frequency[0])
+
+        # Odd number of values
+        data = b"0.1 0.01\n0.2 0.012\n0.3\n"
+        self.assertRaises(ValueError, swprepost.DispersionCurve._parse_pairs,
+                          data)
+
     def test_equal(self):
         dc_a = swprepost.DispersionCurve([1, 2, 3], [4, 5, 6])
         dc_b = swprepost.DispersionCurve([1, 2, 3], [4, 5, 6])
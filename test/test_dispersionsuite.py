@@ -19,6 +19,7 @@
 
 import os
 import logging
+import threading
 
 import numpy as np
 
@@ -73,6 +74,9 @@ class Test_DispersionSuite(TestCase):
         self.assertListEqual([0, 2], dc_suite.identifiers)
         self.assertListEqual([2.1, 1.1], dc_suite.misfits)
 
+        # Invalid type
+        self.assertRaises(TypeError, dc_suite.append, "bad dc_set")
+
     def test_str(self):
         fname = "data/test_dc_mod2_ray2_lov0_shrt.txt"
         suite = swprepost.DispersionSuite.from_geopsy(self.full_path+fname)
@@ -312,6 +316,132 @@ class Test_DispersionSuite(TestCase):
         models = [e1]
         compare(fname, models, nsets=20)
 
+    def test_from_geopsy_nsets(self):
+        fname = self.full_path+"data/test_dc_mod2_ray2_lov2_shrt.txt"
+        dc_suite = swprepost.DispersionSuite.from_geopsy(fname, nsets=1)
+        self.assertEqual(1, dc_suite.size)
+        self.assertListEqual([149641], dc_suite.identifiers)
+        self.assertEqual(2, len(dc_suite[0].rayleigh))
+        self.assertEqual(2, len(dc_suite[0].love))
+
+        fname = self.full_path+"data/test_dc_mod100_ray2_lov2_full.txt"
+        for nsets in [1, 5, 20]:
+            dc_suite = swprepost.DispersionSuite.from_geopsy(fname, nsets=nsets)
+            self.assertEqual(nsets, dc_suite.size)
+
+    def test_from_geopsy_line_endings(self):
+        fname = self.full_path+"data/test_dc_mod2_ray2_lov2_shrt.txt"
+        expected = swprepost.DispersionSuite.from_geopsy(fname)
+
+        with open(fname, "rb") as f:
+            data = f.read()
+        tmp_fname = "dc_suite_crlf.txt"
+        with open(tmp_fname, "wb") as f:
+            f.write(data.replace(b"\n", b"\r\n"))
+        returned = swprepost.DispersionSuite.from_geopsy(tmp_fname)
+        os.remove(tmp_fname)
+        self.assertEqual(expected, returned)
+
+    def test_from_geopsy_bad_data(self):
+        fname = self.full_path+"data/test_dc_mod2_ray2_lov2_shrt.txt"
+        with open(fname, "rb") as f:
+            data = f.read()
+        tmp_fname = "dc_suite_bad.txt"
+        with open(tmp_fname, "wb") as f:
+            f.write(data.replace(b"61.5 0.009", b"61.5 _.009"))
+        self.assertRaises(ValueError, swprepost.DispersionSuite.from_geopsy,
+                          tmp_fname)
+        os.remove(tmp_fname)
+
+        # Misaligned pairs
+        with open(tmp_fname, "wb") as f:
+            f.write(data.replace(b"61.5 0.009", b"61.5 0.009 5", 1))
+        self.assertRaises(ValueError, swprepost.DispersionSuite.from_geopsy,
+                          tmp_fname)
+        os.remove(tmp_fname)
+
+        # Trailing text -> ignored
+        with open(tmp_fname, "wb") as f:
+            f.write(data + b"end of file\n")
+        expected = swprepost.DispersionSuite.from_geopsy(fname)
+        returned = swprepost.DispersionSuite.from_geopsy(tmp_fname)
+        os.remove(tmp_fname)
+        self.assertEqual(expected, returned)
+
+        # No DispersionSets
+        with open(tmp_fname, "w") as f:
+            f.write("# File written by swipp\n")
+        self.assertRaises(ValueError, swprepost.DispersionSuite.from_geopsy,
+                          tmp_fname)
+        os.remove(tmp_fname)
+
+    def test_open_buffer(self):
+        from swprepost.dispersionsuite import _open_buffer
+
+        # Empty files cannot be memory-mapped, fall back to reading.
+        tmp_fname = "dc_suite_empty.txt"
+        open(tmp_fname, "w").close()
+        with _open_buffer(tmp_fname) as (buf, mapped):
+            self.assertEqual(b"", buf)
+            self.assertFalse(mapped)
+        try:
+            with _open_buffer(tmp_fname):
+                raise KeyError("caller")
+        except KeyError as e:
+            self.assertIsNone(e.__context__)
+        os.remove(tmp_fname)
+
+    def test_from_geopsy_ncores(self):
+        fname = self.full_path+"data/test_dc_mod100_ray2_lov2_full.txt"
+        expected = swprepost.DispersionSuite.from_geopsy(fname)
+        for ncores in [2, 3]:
+            returned = swprepost.DispersionSuite.from_geopsy(fname,
+                                                             ncores=ncores)
+            self.assertListEqual(expected.identifiers, returned.identifiers)
+            self.assertEqual(expected, returned)
+
+    @unittest.skipUnless(hasattr(os, "mkfifo"), "requires os.mkfifo")
+    def test_from_geopsy_ncores_pipe(self):
+        fname = self.full_path+"data/test_dc_mod100_ray2_lov2_full.txt"
+        expected = swprepost.DispersionSuite.from_geopsy(fname)
+        with open(fname, "rb") as f:
+            data = f.read()
+
+        # Pipes cannot be memory-mapped -> parsed in the current process.
+        tmp_fname = "dc_suite_pipe.txt"
+        os.mkfifo(tmp_fname)
+
+        def write():
+            with open(tmp_fname, "wb") as f:
+                f.write(data)
+
+        writer = threading.Thread(target=write, daemon=True)
+        writer.start()
+        returned = swprepost.DispersionSuite.from_geopsy(tmp_fname, ncores=2)
+        writer.join()
+        os.remove(tmp_fname)
+        self.assertEqual(expected, returned)
+
+    def test_from_list(self):
+        dc = swprepost.DispersionCurve([1, 2, 3], [10, 20, 30])
+        dc_sets = [swprepost.DispersionSet(_id, misfit=misfit, rayleigh={0: dc})
+                   for _id, misfit in zip([0, 1, 2, 3], [0.3, 0.1, 0.2, 0.1])]
+
+        # Unsorted
+        dc_suite = swprepost.DispersionSuite.from_list(dc_sets, sort=False)
+        self.assertListEqual([0, 1, 2, 3], dc_suite.identifiers)
+        self.assertListEqual([0.3, 0.1, 0.2, 0.1], dc_suite.misfits)
+
+        # Sorted
+        dc_suite = swprepost.DispersionSuite.from_list(dc_sets, sort=True)
+        self.assertListEqual([1, 3, 2, 0], dc_suite.identifiers)
+        self.assertListEqual([0.1, 0.1, 0.2, 0.3], dc_suite.misfits)
+
+        # Bad values
+        self.assertRaises(TypeError, swprepost.DispersionSuite.from_list,
+                          [dc_sets[0], "bad dc_set"])
+        self.assertRaises(ValueError, swprepost.DispersionSuite.from_list, [])
+
     def test_write_to_txt(self):
         dc_0 = swprepost.DispersionCurve([1, 5, 10, 15], [100, 200, 300, 400])
         dc_1 = swprepost.DispersionCurve([1, 5, 12, 15], [100, 180, 300, 400])
@@ -331,6 +461,24 @@ class Test_DispersionSuite(TestCase):
 
         self.assertEqual(expected, returned)
 
+        # nbest -> lowest misfit
+        dc_sets = [swprepost.DispersionSet(_id, misfit=misfit, rayleigh={0: dc_0})
+                   for _id, misfit in zip(range(5), [0.5, 0.2, 0.4, 0.2, 0.1])]
+        suite = swprepost.DispersionSuite.from_list(dc_sets, sort=False)
+        for nbest, expected in zip([1, 2, 3, "all"],
+                                   [[4], [4, 1], [4, 1, 3], [4, 1, 3, 2, 0]]):
+            suite.write_to_txt(fname, nbest=nbest)
+            returned = swprepost.DispersionSuite.from_geopsy(fname)
+            os.remove(fname)
+            self.assertListEqual(expected, returned.identifiers)
+
+        # nbest=0 -> header only
+        suite.write_to_txt(fname, nbest=0)
+        with open(fname, "r") as f:
+            returned = f.read()
+        os.remove(fname)
+        self.assertEqual("# File written by swipp\n", returned)
+
     def test_eq(self):
         dc = swprepost.DispersionCurve([1,2,3],[10,20,30])
         dc_set = swprepost.DispersionSet(0, rayleigh={0:dc})
@@ -21,6 +21,8 @@ import os
 import logging
 import warnings
 
+import numpy as np
+
 import swprepost
 from testtools import unittest, TestCase
 
@@ -220,8 +222,10 @@ class Test_Parameter(TestCase):
             mindepth, maxdepth = swprepost.Parameter.depth_lr(wmin, wmax,
                                                               lr=float(key),
                                                               depth_factor=2)
-            self.assertListAlmostEqual(expected_mindepth, mindepth, places=1)
-            self.assertListAlmostEqual(expected_maxdepth, maxdepth, places=1)
+            np.testing.assert_allclose(mindepth, expected_mindepth,
+                                       rtol=0, atol=0.05)
+            np.testing.assert_allclose(maxdepth, expected_maxdepth,
+                                       rtol=0, atol=0.05)
 
     def test_from_lr(self):
         wmin, wmax = 1, 100
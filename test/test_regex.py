@@ -0,0 +1,62 @@
+# This file is part of swprepost, a Python package for surface-wave
+# inversion pre- and post-processing.
+# Copyright (C) 2019-2020 Joseph P. Vantassel (jvantassel@utexas.edu)
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     This program is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see <https: //www.gnu.org/licenses/>.
+
+"""Tests for regular expressions."""
+
+import time
+import logging
+
+from swprepost import regex
+from testtools import unittest, TestCase
+
+logging.basicConfig(level=logging.ERROR)
+
+
+class Test_Regex(TestCase):
+
+    def test_model(self):
+        for value in ["0.5", "1.", "3", "1.5e-03", "2E+01"]:
+            text = f"# Layered model 12: value={value}"
+            identifier, misfit = regex.model.search(text).groups()
+            self.assertEqual("12", identifier)
+            self.assertEqual(value, misfit)
+            self.assertEqual(float(value), float(misfit))
+
+    def test_dc_header(self):
+        text = (b"# Layered model 3: value=1.5e-03\n"
+                b"# 1 Rayleigh dispersion mode(s)\n"
+                b"# CPU Time\n")
+        match = regex.dc_header.match(text)
+        self.assertEqual(b"3", match.group("identifier"))
+        self.assertEqual(1.5e-03, float(match.group("misfit")))
+        self.assertEqual(b"Rayleigh", match.group("wave"))
+        self.assertEqual(len(text), match.end())
+
+    def test_dcset_malformed_line(self):
+        # Nested quantifiers in number used to backtrack exponentially.
+        text = ("# Layered model 0: value=0.5\n"
+                "# 1 Rayleigh dispersion mode(s)\n"
+                "# CPU Time\n"
+                "# Mode 0\n"
+                f"{'1'*3000} 0.01 x\n")
+        start = time.perf_counter()
+        self.assertIsNone(regex.dcset.search(text))
+        self.assertLess(time.perf_counter() - start, 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -55,6 +55,34 @@ class Test_Suite(TestCase):
         self.assertRaises(
             ValueError, self.gm_suite._handle_nbest, nbest="tada")
 
+    def test_sort(self):
+        # GroundModelSuite
+        self.assertListEqual([0.1, 0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 1],
+                             self.gm_suite.misfits)
+        self.assertListEqual([7, 9, 8, 3, 4, 0, 5, 6, 1, 2],
+                             self.gm_suite.identifiers)
+        self.assertListEqual(self.gm_suite.identifiers,
+                             [gm.identifier for gm in self.gm_suite.gms])
+
+        # Returned values cannot desync the suite
+        gm_suite = swprepost.GroundModelSuite.from_list(list(self.gm_suite.gms))
+        identifiers = gm_suite.identifiers
+        identifiers.sort()
+        misfits = gm_suite.misfits
+        misfits.reverse()
+        self.assertListEqual([7, 9, 8, 3, 4, 0, 5, 6, 1, 2],
+                             gm_suite.identifiers)
+        self.assertListEqual([0.1, 0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 1],
+                             gm_suite.misfits)
+        self.assertFalse(hasattr(gm_suite.gms, "append"))
+
+        # Read-only view is reused until the suite changes
+        self.assertIs(gm_suite.gms, gm_suite.gms)
+        gms = gm_suite.gms
+        gm_suite.append(gms[0], sort=False)
+        self.assertEqual(11, len(gm_suite.gms))
+        self.assertEqual(10, len(gms))
+
     def test_misfit_range(self):
         # GroundModelSuite
         for nmodels, expected in zip(["all", 1, 5], [(0.1, 1), 0.1, (0.1, 0.4)]):